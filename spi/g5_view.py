@@ -38,16 +38,18 @@ class G5View(View):
 
         history = UserBlockHistory(wiki.user_blocks(case_name))
 
+        candidates = [contrib for contrib in wiki.user_contributions(sock_names, show="new")
+                      if history.is_blocked_at(contrib.timestamp)]
+        exists = wiki.pages_exist(contrib.title for contrib in candidates)
+
         page_creations = []
-        for contrib in wiki.user_contributions(sock_names, show="new"):
-            if history.is_blocked_at(contrib.timestamp):
+        for contrib in candidates:
+            if exists[contrib.title]:
                 title = contrib.title
-                page = wiki.page(title)
-                if page.exists():
-                    page_creations.append(G5Summary(title,
-                                                    contrib.user_name,
-                                                    contrib.timestamp,
-                                                    self.g5_score(page)))
+                page_creations.append(G5Summary(title,
+                                                contrib.user_name,
+                                                contrib.timestamp,
+                                                self.g5_score(wiki.page(title))))
 
         context = {'case_name': case_name,
                    'page_creations': page_creations,
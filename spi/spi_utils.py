@@ -3,7 +3,6 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List
 from ipaddress import IPv4Address, IPv4Network
-from itertools import chain
 import re
 
 from mwparserfromhell import parse
@@ -14,6 +13,12 @@ from django.core.cache import cache
 # pylint: disable=invalid-name
 
 
+# Template names, as normalized by _normalize_template_name().
+SOCKLIST_TEMPLATES = frozenset(['Sock list', 'Socklist'])
+USER_TEMPLATES = frozenset(['Checkuser', 'User', 'Checkip', 'CheckIP', 'SPIarchive notice'])
+IP_TEMPLATES = frozenset(['Checkip', 'CheckIP'])
+
+
 class ArchiveError(ValueError):
     pass
 
@@ -53,9 +58,8 @@ class CacheableSpiCase:
 
     @staticmethod
     def get(wiki, master_name):
-        titles = (f'Wikipedia:Sockpuppet investigations/{master_name}{suffix}' for suffix in ['', '/Archive'])
-        revisions = chain.from_iterable([wiki.page(t).revisions(count=1) for t in titles])
-        rev_id = max(r.rev_id for r in revisions)
+        titles = [f'Wikipedia:Sockpuppet investigations/{master_name}{suffix}' for suffix in ['', '/Archive']]
+        rev_id = max(r for r in wiki.latest_revision_ids(titles).values() if r is not None)
         key = f'spi.CacheableSpiCase.{master_name}'
         case = cache.get(key, version=rev_id)
         if case is None:
@@ -82,10 +86,11 @@ class SpiCase:
 
         """
         case_title = f'Wikipedia:Sockpuppet investigations/{master_name}'
-        case_doc = SpiSourceDocument(case_title, wiki.page(case_title).text())
-        docs = [case_doc]
         archive_title = f'{case_title}/Archive'
-        archive_text = wiki.page(archive_title).text()
+        texts = wiki.page_texts([case_title, archive_title])
+        case_doc = SpiSourceDocument(case_title, texts[case_title])
+        docs = [case_doc]
+        archive_text = texts[archive_title]
         if archive_text:
             archive_doc = SpiSourceDocument(archive_title, archive_text)
             docs.append(archive_doc)
@@ -185,7 +190,7 @@ class SpiCaseDay:
         '''
         date = self.date()
         templates = self.wikicode.filter_templates(
-            matches=lambda n: n.name.matches(['sock list', 'socklist']))
+            matches=lambda n: _normalize_template_name(n.name) in SOCKLIST_TEMPLATES)
         for template in templates:
             for param_key, param_value in template.params.items():
                 if param_key.removeprefix('sock').removeprefix('ip').isdigit():
@@ -201,11 +206,7 @@ class SpiCaseDay:
         '''
         date = self.date()
         templates = self.wikicode.filter_templates(
-            matches=lambda n: n.name.matches(['checkuser',
-                                              'user',
-                                              'checkip',
-                                              'checkIP',
-                                              'SPIarchive notice']))
+            matches=lambda n: _normalize_template_name(n.name) in USER_TEMPLATES)
         for template in templates:
             username = template.get('1').value
             yield SpiUserInfo(str(username), str(date))
@@ -239,7 +240,7 @@ class SpiCaseDay:
         '''
         date = self.date()
         templates = self.wikicode.filter_templates(
-            matches=lambda n: n.name.matches(['checkip', 'checkIP']))
+            matches=lambda n: _normalize_template_name(n.name) in IP_TEMPLATES)
         for template in templates:
             ip_str = template.get('1').value
             try:
@@ -306,20 +307,41 @@ def get_current_case_names(wiki):
 
     """
     template_name = _find_active_case_template(wiki)
-    overview = wiki.page(template_name).text()
+    overview = wiki.page_text(template_name)
     wikicode = parse(overview)
-    templates = wikicode.filter_templates(matches=lambda n: n.name.matches('SPIstatusentry'))
+    # The overview can have thousands of templates; comparing plain
+    # strings is several times faster than calling Wikicode.matches()
+    # on each template name.  The same goes for the case pages (see
+    # the *_TEMPLATES sets above).
+    templates = (t for t in wikicode.ifilter_templates()
+                 if _normalize_template_name(t.name) == 'SPIstatusentry')
     raw_names = {str(t.get(1)) for t in templates}
     return [name for name in raw_names if '/' not in name]
 
 
+def _normalize_template_name(name):
+    """Normalize a template name (a Wikicode object, e.g. Template.name)
+    the way mediawiki does, i.e. ignoring comments and other markup,
+    surrounding whitespace, treating underscores as spaces, and
+    ignoring the case of the first letter.
+
+    """
+    text = str(name)
+    if '<' in text:
+        # Rare, and strip_code() is slow, so only pay for it when
+        # there might be a comment or tag to remove.
+        text = name.strip_code()
+    text = text.strip().replace('_', ' ')
+    return text[:1].upper() + text[1:]
+
+
 def _find_active_case_template(wiki):
     """Return the name of the curently active template listing SPI cases.
 
     Returns None if the template can't be determined.
 
     """
-    spi_page = wiki.page('Wikipedia:Sockpuppet investigations').text()
+    spi_page = wiki.page_text('Wikipedia:Sockpuppet investigations')
     wikicode = parse(spi_page)
     template_names = [t.name for t in wikicode.filter_templates()]
     candidates = ['Wikipedia:Sockpuppet investigations/Cases/Overview',
@@ -1,7 +1,11 @@
 from unittest.mock import patch
+from datetime import datetime, timezone
 
 from spi.test_views import ViewTestCase
 from spi.views import ValidatedUser
+from spi.g5_view import G5Summary, G5Score
+from wiki_interface.data import WikiContrib
+from wiki_interface.block_utils import BlockEvent
 
 
 class G5ViewTest(ViewTestCase):
@@ -21,3 +25,26 @@ class G5ViewTest(ViewTestCase):
         response = self.client.get('/spi/g5/Fred')
 
         self.assertEqual(response.status_code, 200)
+
+
+    @patch('spi.g5_view.get_sock_names', autospec=True)
+    def test_page_existence_is_checked_in_one_call(self, mock_get_sock_names):
+        jan_1 = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        feb_1 = datetime(2020, 2, 1, tzinfo=timezone.utc)
+        self.mock_wiki.user_blocks.return_value = [BlockEvent('Fred', jan_1, 1)]
+        self.mock_wiki.user_contributions.return_value = [
+            WikiContrib(101, feb_1, 'User1', 0, 'Page1', ''),
+            WikiContrib(102, feb_1, 'User1', 0, 'Page2', ''),
+        ]
+        self.mock_wiki.pages_exist.return_value = {'Page1': True, 'Page2': False}
+        self.mock_wiki.page.return_value.revisions.return_value = []
+        mock_get_sock_names.return_value = [ValidatedUser("User1", "20 June 2020", True)]
+
+        response = self.client.get('/spi/g5/Fred')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(self.mock_wiki.pages_exist.call_args[0][0]), ['Page1', 'Page2'])
+        self.mock_wiki.pages_exist.assert_called_once()
+        self.mock_wiki.page.assert_called_once_with('Page1')
+        self.assertEqual(response.context['page_creations'],
+                         [G5Summary('Page1', 'User1', feb_1, G5Score('unknown'))])
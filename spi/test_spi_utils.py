@@ -1,12 +1,10 @@
 from unittest import TestCase
-from unittest.mock import patch, call, NonCallableMock
+from unittest.mock import patch, NonCallableMock
 from textwrap import dedent
 from ipaddress import IPv4Network
-from datetime import datetime
 import mwparserfromhell
 
 from wiki_interface import Wiki
-from wiki_interface.data import WikiContrib
 from spi.spi_utils import (SpiSourceDocument, SpiCase, SpiCaseDay, SpiIpInfo, SpiUserInfo, CacheableSpiCase,
                            ArchiveError, get_current_case_names, _find_active_case_template)
 
@@ -31,20 +29,18 @@ class CacheableSpiCaseTest(TestCase):
     @patch('spi.spi_utils.cache')
     def test_get_with_empty_cache_and_empty_case(self, cache):
         wiki = NonCallableMock(Wiki)
-        wiki.page().revisions.side_effect = [
-            [WikiContrib(2020_07_29, datetime(2020, 7, 29), 'user1', 4, 'Wikipedia:Sockpuppet investigations/Fred', '')],
-            [WikiContrib(2020_07_28, datetime(2020, 7, 28), 'user1', 4, 'Wikipedia:Sockpuppet investigations/Fred/Archive', '')],
-        ]
-        wiki.page().text.side_effect = [
-            dedent(
+        wiki.latest_revision_ids.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': 2020_07_29,
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': 2020_07_28,
+        }
+        wiki.page_texts.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': dedent(
                 '''
                 {{SPIarchive notice|1=Fred}}
                 '''),
-            dedent(
-                '''
-                ''')]
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': '',
+        }
         cache.get.return_value = None
-        wiki.page.reset_mock()
 
         case = CacheableSpiCase.get(wiki, 'Fred')
 
@@ -52,12 +48,10 @@ class CacheableSpiCaseTest(TestCase):
                                          2020_07_29,
                                          [SpiUserInfo('Fred', None)],
                                          [])
-        self.assertEqual(wiki.page.call_args_list, [
-            call('Wikipedia:Sockpuppet investigations/Fred'),
-            call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-            call('Wikipedia:Sockpuppet investigations/Fred'),
-            call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-        ])
+        wiki.latest_revision_ids.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                          'Wikipedia:Sockpuppet investigations/Fred/Archive'])
+        wiki.page_texts.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                 'Wikipedia:Sockpuppet investigations/Fred/Archive'])
         cache.get.assert_called_once_with('spi.CacheableSpiCase.Fred', version=2020_07_29)
         cache.set.assert_called_once_with('spi.CacheableSpiCase.Fred', expected_case, version=2020_07_29)
         self.assertEqual(case, expected_case)
@@ -66,20 +60,18 @@ class CacheableSpiCaseTest(TestCase):
     @patch('spi.spi_utils.cache')
     def test_rev_id_is_populated_with_latest_id_from_current_page(self, cache):
         wiki = NonCallableMock(Wiki)
-        wiki.page().revisions.side_effect = [
-            [WikiContrib(2020_07_29, datetime(2020, 7, 29), 'user1', 4, 'Wikipedia:Sockpuppet investigations/Fred', '')],
-            [WikiContrib(2020_07_28, datetime(2020, 7, 28), 'user1', 4, 'Wikipedia:Sockpuppet investigations/Fred/Archive', '')],
-        ]
-        wiki.page().text.side_effect = [
-            dedent(
+        wiki.latest_revision_ids.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': 2020_07_29,
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': 2020_07_28,
+        }
+        wiki.page_texts.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': dedent(
                 '''
                 {{SPIarchive notice|1=Fred}}
                 '''),
-            dedent(
-                '''
-                ''')]
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': '',
+        }
         cache.get.return_value = None
-        wiki.page.reset_mock()
 
         case = CacheableSpiCase.get(wiki, 'Fred')
 
@@ -87,12 +79,10 @@ class CacheableSpiCaseTest(TestCase):
                                          2020_07_29,
                                          [SpiUserInfo('Fred', None)],
                                          [])
-        self.assertEqual(wiki.page.call_args_list, [
-            call('Wikipedia:Sockpuppet investigations/Fred'),
-            call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-            call('Wikipedia:Sockpuppet investigations/Fred'),
-            call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-            ])
+        wiki.latest_revision_ids.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                          'Wikipedia:Sockpuppet investigations/Fred/Archive'])
+        wiki.page_texts.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                 'Wikipedia:Sockpuppet investigations/Fred/Archive'])
         cache.get.assert_called_once_with('spi.CacheableSpiCase.Fred', version=2020_07_29)
         cache.set.assert_called_once_with('spi.CacheableSpiCase.Fred', expected_case, version=2020_07_29)
         self.assertEqual(case.rev_id, 2020_07_29)
@@ -101,20 +91,18 @@ class CacheableSpiCaseTest(TestCase):
     @patch('spi.spi_utils.cache')
     def test_rev_id_is_populated_with_latest_id_from_archive(self, cache):
         wiki = NonCallableMock(Wiki)
-        wiki.page().revisions.side_effect = [
-            [WikiContrib(2020_07_29, datetime(2020, 7, 29), 'user1', 4, 'Wikipedia:Sockpuppet investigations/Fred', '')],
-            [WikiContrib(2020_07_30, datetime(2020, 7, 30), 'user1', 4, 'Wikipedia:Sockpuppet investigations/Fred/Archive', '')],
-        ]
-        wiki.page().text.side_effect = [
-            dedent(
+        wiki.latest_revision_ids.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': 2020_07_29,
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': 2020_07_30,
+        }
+        wiki.page_texts.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': dedent(
                 '''
                 {{SPIarchive notice|1=Fred}}
                 '''),
-            dedent(
-                '''
-                ''')]
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': '',
+        }
         cache.get.return_value = None
-        wiki.page.reset_mock()
 
         case = CacheableSpiCase.get(wiki, 'Fred')
 
@@ -122,12 +110,10 @@ class CacheableSpiCaseTest(TestCase):
                                          2020_07_30,
                                          [SpiUserInfo('Fred', None)],
                                          [])
-        self.assertEqual(wiki.page.call_args_list, [
-            call('Wikipedia:Sockpuppet investigations/Fred'),
-            call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-            call('Wikipedia:Sockpuppet investigations/Fred'),
-            call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-            ])
+        wiki.latest_revision_ids.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                          'Wikipedia:Sockpuppet investigations/Fred/Archive'])
+        wiki.page_texts.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                 'Wikipedia:Sockpuppet investigations/Fred/Archive'])
         cache.get.assert_called_once_with('spi.CacheableSpiCase.Fred', version=2020_07_30)
         cache.set.assert_called_once_with('spi.CacheableSpiCase.Fred', expected_case, version=2020_07_30)
         self.assertEqual(case.rev_id, 2020_07_30)
@@ -136,20 +122,18 @@ class CacheableSpiCaseTest(TestCase):
     @patch('spi.spi_utils.cache')
     def test_rev_id_is_populated_with_current_page_id_if_archive_is_missing(self, cache):
         wiki = NonCallableMock(Wiki)
-        wiki.page().revisions.side_effect = [
-            [WikiContrib(2020_07_29, datetime(2020, 7, 29), 'user1', 4, 'Wikipedia:Sockpuppet investigations/Fred', '')],
-            [],
-        ]
-        wiki.page().text.side_effect = [
-            dedent(
+        wiki.latest_revision_ids.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': 2020_07_29,
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': None,
+        }
+        wiki.page_texts.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': dedent(
                 '''
                 {{SPIarchive notice|1=Fred}}
                 '''),
-            dedent(
-                '''
-                ''')]
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': '',
+        }
         cache.get.return_value = None
-        wiki.page.reset_mock()
 
         case = CacheableSpiCase.get(wiki, 'Fred')
 
@@ -157,12 +141,10 @@ class CacheableSpiCaseTest(TestCase):
                                          2020_07_29,
                                          [SpiUserInfo('Fred', None)],
                                          [])
-        self.assertEqual(wiki.page.call_args_list, [
-            call('Wikipedia:Sockpuppet investigations/Fred'),
-            call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-            call('Wikipedia:Sockpuppet investigations/Fred'),
-            call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-        ])
+        wiki.latest_revision_ids.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                          'Wikipedia:Sockpuppet investigations/Fred/Archive'])
+        wiki.page_texts.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                 'Wikipedia:Sockpuppet investigations/Fred/Archive'])
         cache.get.assert_called_once_with('spi.CacheableSpiCase.Fred', version=2020_07_29)
         cache.set.assert_called_once_with('spi.CacheableSpiCase.Fred', expected_case, version=2020_07_29)
         self.assertEqual(case.rev_id, 2020_07_29)
@@ -171,20 +153,17 @@ class CacheableSpiCaseTest(TestCase):
     @patch('spi.spi_utils.cache')
     def test_cached_value_is_used_if_version_matches(self, cache):
         wiki = NonCallableMock(Wiki)
-        wiki.page().revisions.side_effect = [
-            [WikiContrib(2020_07_29, datetime(2020, 7, 29), 'user1', 4, 'Wikipedia:Sockpuppet investigations/Fred', '')],
-            [],
-        ]
+        wiki.latest_revision_ids.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': 2020_07_29,
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': None,
+        }
         cache.get.return_value = CacheableSpiCase('Fred', 2020_07_29)
-        wiki.page.reset_mock()
         cache.reset_mock()
 
         case = CacheableSpiCase.get(wiki, 'Fred')
 
-        self.assertEqual(wiki.page.call_args_list, [
-            call('Wikipedia:Sockpuppet investigations/Fred'),
-            call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-        ])
+        wiki.latest_revision_ids.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                          'Wikipedia:Sockpuppet investigations/Fred/Archive'])
         cache.get.assert_called_once_with('spi.CacheableSpiCase.Fred', version=2020_07_29)
         cache.set.assert_not_called()
         self.assertEqual(case.rev_id, 2020_07_29)
@@ -193,22 +172,19 @@ class CacheableSpiCaseTest(TestCase):
 class SpiCaseTest(TestCase):
     def test_for_master_with_no_data(self):
         wiki = NonCallableMock(Wiki)
-        wiki.page().text.side_effect = [
-            dedent(
+        wiki.page_texts.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': dedent(
                 '''
                 {{SPIarchive notice|1=Fred}}
                 '''),
-            dedent(
-                '''
-                ''')]
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': '',
+        }
         wiki.reset_mock()
 
         case = SpiCase.for_master(wiki, 'Fred')
 
-        self.assertEqual(wiki.page.call_args_list,
-                         [call('Wikipedia:Sockpuppet investigations/Fred'),
-                          call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-                         ])
+        wiki.page_texts.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                 'Wikipedia:Sockpuppet investigations/Fred/Archive'])
         self.assertEqual(case.master_name, 'Fred')
         self.assertEqual(list(case.days()), [])
         self.assertEqual(list(case.find_all_ips()), [])
@@ -217,8 +193,8 @@ class SpiCaseTest(TestCase):
 
     def test_for_master_with_multiple_days(self):
         wiki = NonCallableMock(Wiki)
-        wiki.page().text.side_effect = [
-            dedent(
+        wiki.page_texts.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': dedent(
                 '''
                 {{SPIarchive notice|1=Fred}}
                 ===21 March 2019===
@@ -229,17 +205,14 @@ class SpiCaseTest(TestCase):
                 {{checkuser|user4}}
 
                 '''),
-            dedent(
-                '''
-                ''')]
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': '',
+        }
         wiki.reset_mock()
 
         case = SpiCase.for_master(wiki, 'Fred')
 
-        self.assertEqual(wiki.page.call_args_list,
-                         [call('Wikipedia:Sockpuppet investigations/Fred'),
-                          call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-                         ])
+        wiki.page_texts.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                 'Wikipedia:Sockpuppet investigations/Fred/Archive'])
         self.assertEqual(case.master_name, 'Fred')
         self.assertEqual(list(case.find_all_ips()), [])
         self.assertEqual(list(case.find_all_users()),
@@ -253,8 +226,8 @@ class SpiCaseTest(TestCase):
 
     def test_for_master_with_multiple_days_and_mixed_new_and_old_style_headers(self):
         wiki = NonCallableMock(Wiki)
-        wiki.page().text.side_effect = [
-            dedent(
+        wiki.page_texts.return_value = {
+            'Wikipedia:Sockpuppet investigations/Fred': dedent(
                 '''
                 {{SPIarchive notice|1=Fred}}
                 =====<big>21 March 2019</big>=====
@@ -265,17 +238,14 @@ class SpiCaseTest(TestCase):
                 {{checkuser|user4}}
 
                 '''),
-            dedent(
-                '''
-                ''')]
+            'Wikipedia:Sockpuppet investigations/Fred/Archive': '',
+        }
         wiki.reset_mock()
 
         case = SpiCase.for_master(wiki, 'Fred')
 
-        self.assertEqual(wiki.page.call_args_list,
-                         [call('Wikipedia:Sockpuppet investigations/Fred'),
-                          call('Wikipedia:Sockpuppet investigations/Fred/Archive'),
-                         ])
+        wiki.page_texts.assert_called_once_with(['Wikipedia:Sockpuppet investigations/Fred',
+                                                 'Wikipedia:Sockpuppet investigations/Fred/Archive'])
         self.assertEqual(case.master_name, 'Fred')
         self.assertEqual(list(case.find_all_ips()), [])
         self.assertEqual(list(case.find_all_users()),
@@ -470,6 +440,30 @@ class SpiCaseDayTest(TestCase):
 
 
 
+    def test_find_users_accepts_checkip_variants(self):
+        text = '''
+        ===21 March 2019===
+        {{Checkip|1.2.3.4}}
+        {{CheckIP|5.6.7.8}}
+        '''
+        day = SpiCaseDay(make_code(text), 'title')
+        users = list(day.find_users())
+        self.assertCountEqual(users, [SpiUserInfo('1.2.3.4', '21 March 2019'),
+                                      SpiUserInfo('5.6.7.8', '21 March 2019')])
+
+
+    def test_find_users_ignores_comment_in_template_name(self):
+        text = '''
+        ===21 March 2019===
+        {{checkuser<!-- x -->|user1}}
+        {{user <!-- x -->|user2}}
+        '''
+        day = SpiCaseDay(make_code(text), 'title')
+        users = list(day.find_users())
+        self.assertCountEqual(users, [SpiUserInfo('user1', '21 March 2019'),
+                                      SpiUserInfo('user2', '21 March 2019')])
+
+
     def test_find_user_instances(self):
         text = '''
         ===21 March 2019===
@@ -582,6 +576,16 @@ class SpiCaseDayTest(TestCase):
 
 
 
+    def test_find_ips_ignores_comment_in_template_name(self):
+        text = '''
+        ===21 March 2019===
+        {{checkip <!-- x -->|1.2.3.4}}
+        '''
+        day = SpiCaseDay(make_code(text), 'title')
+        ips = list(day.find_ips())
+        self.assertEqual(ips, [SpiIpInfo('1.2.3.4', '21 March 2019', 'title')])
+
+
 class SpiUserInfoTest(TestCase):
     def test_eq(self):
         info1 = SpiUserInfo('user', '1 January 2019')
@@ -638,24 +642,23 @@ class SpiIpInfoTest(TestCase):
 class GetCurrentCaseNamesTest(TestCase):
     # pylint: disable=invalid-name
 
-    @patch('wiki_interface.wiki.Site')
     @patch('spi.spi_utils._find_active_case_template')
-    def test_no_entries(self, mock__find_active_case_template, mock_Site):
+    def test_no_entries(self, mock__find_active_case_template):
         mock__find_active_case_template.return_value = 'whatever'
-        mock_Site().pages.__getitem__().text.return_value = ''
+        wiki = NonCallableMock(Wiki)
+        wiki.page_text.return_value = ''
 
-        wiki = Wiki()
         names = get_current_case_names(wiki)
 
         self.assertEqual(names, [])
-        mock_Site().pages.__getitem__().text.assert_called_once_with()
+        wiki.page_text.assert_called_once_with('whatever')
 
 
-    @patch('wiki_interface.wiki.Site')
     @patch('spi.spi_utils._find_active_case_template')
-    def test_multiple_entries_with_duplicates(self, mock__find_active_case_template, mock_Site):
+    def test_multiple_entries_with_duplicates(self, mock__find_active_case_template):
         mock__find_active_case_template.return_value = 'whatever'
-        mock_Site().pages.__getitem__().text.return_value = '''
+        wiki = NonCallableMock(Wiki)
+        wiki.page_text.return_value = '''
         {{SPIstatusheader}}
         {{SPIstatusentry|Rajumitwa878|--|--|--|--|--|--}}
         {{SPIstatusentry|AntiRacistSwede|--|--|--|--|--|--}}
@@ -663,51 +666,65 @@ class GetCurrentCaseNamesTest(TestCase):
         {{SPIstatusentry|AntiRacistSwede|--|--|--|--|--|--}}
         '''
 
-        wiki = Wiki()
         names = get_current_case_names(wiki)
 
         self.assertCountEqual(names, ['Rajumitwa878', 'AntiRacistSwede', 'Trumanshow69'])
-        mock_Site().pages.__getitem__().text.assert_called_once_with()
+        wiki.page_text.assert_called_once_with('whatever')
 
 
-    @patch('wiki_interface.wiki.Site')
     @patch('spi.spi_utils._find_active_case_template')
-    def test_case_name_with_slash(self, mock__find_active_case_template, mock_Site):
+    def test_case_name_with_slash(self, mock__find_active_case_template):
         mock__find_active_case_template.return_value = 'whatever'
-        mock_Site().pages.__getitem__().text.return_value = '''
+        wiki = NonCallableMock(Wiki)
+        wiki.page_text.return_value = '''
         {{SPIstatusheader}}
         {{SPIstatusentry|Rajumitwa878|--|--|--|--|--|--}}
         {{SPIstatusentry|AntiRacistSwede|--|--|--|--|--|--}}
         {{SPIstatusentry|2605:E000:1F00:D3F1:0:0:0:0/64|--|--|--|--|--|--}}
         '''
 
-        wiki = Wiki()
         names = get_current_case_names(wiki)
 
         self.assertEqual(set(names), {'Rajumitwa878', 'AntiRacistSwede'})
-        mock_Site().pages.__getitem__().text.assert_called_once_with()
+        wiki.page_text.assert_called_once_with('whatever')
+
+
+    @patch('spi.spi_utils._find_active_case_template')
+    def test_template_name_is_normalized(self, mock__find_active_case_template):
+        mock__find_active_case_template.return_value = 'whatever'
+        wiki = NonCallableMock(Wiki)
+        wiki.page_text.return_value = '''
+        {{SPIstatusheader}}
+        {{SPIstatusentry|Rajumitwa878|--|--|--|--|--|--}}
+        {{ sPIstatusentry |AntiRacistSwede|--|--|--|--|--|--}}
+        {{SPIstatusentry2|Trumanshow69|--|--|--|--|--|--}}
+        {{SPIstatusentry<!-- comment -->|Foo|--|--|--|--|--|--}}
+        '''
+
+        names = get_current_case_names(wiki)
+
+        self.assertCountEqual(names, ['Rajumitwa878', 'AntiRacistSwede', 'Foo'])
 
 
 class FindActiveCaseTemplateTest(TestCase):
     # pylint: disable=invalid-name
 
-    @patch('wiki_interface.wiki.Site')
-    def test_overview(self, mock_Site):
-        mock_Site().pages.__getitem__().text.return_value = '''
+    def test_overview(self):
+        wiki = NonCallableMock(Wiki)
+        wiki.page_text.return_value = '''
         <h2> Cases currently listed at SPI </h2>
         {{purge box}}
         {{Wikipedia:Sockpuppet investigations/Cases/Overview}}
         <!-- This can be used as a backup: {{User:AmandaNP/SPI case list}} -->
         '''
 
-        wiki = Wiki()
         template = _find_active_case_template(wiki)
         self.assertEqual(template, 'Wikipedia:Sockpuppet investigations/Cases/Overview')
 
 
-    @patch('wiki_interface.wiki.Site')
-    def test_amanda(self, mock_Site):
-        mock_Site().pages.__getitem__().text.return_value = '''
+    def test_amanda(self):
+        wiki = NonCallableMock(Wiki)
+        wiki.page_text.return_value = '''
         <h2> Cases currently listed at SPI </h2>
         {{purge box}}
         <!-- Switching to backup. {{Wikipedia:Sockpuppet investigations/Cases/Overview}}-->
@@ -715,14 +732,13 @@ class FindActiveCaseTemplateTest(TestCase):
         |}
         '''
 
-        wiki = Wiki()
         template = _find_active_case_template(wiki)
         self.assertEqual(template, 'User:AmandaNP/SPI case list')
 
 
-    @patch('wiki_interface.wiki.Site')
-    def test_mz7(self, mock_Site):
-        mock_Site().pages.__getitem__().text.return_value = '''
+    def test_mz7(self):
+        wiki = NonCallableMock(Wiki)
+        wiki.page_text.return_value = '''
         <h2> Cases currently listed at SPI </h2>
         {{purge box}}
         <!-- Switching to backup for the time being, main case list at {{Wikipedia:Sockpuppet investigations/Cases/Overview}} -->
@@ -734,14 +750,13 @@ class FindActiveCaseTemplateTest(TestCase):
         -->
         '''
 
-        wiki = Wiki()
         template = _find_active_case_template(wiki)
         self.assertEqual(template, 'User:Mz7/SPI case list')
 
 
-    @patch('wiki_interface.wiki.Site')
-    def test_None(self, mock_Site):
-        mock_Site().pages.__getitem__().text.return_value = '''
+    def test_None(self):
+        wiki = NonCallableMock(Wiki)
+        wiki.page_text.return_value = '''
         <h2> Cases currently listed at SPI </h2>
         {{purge box}}
         <!-- Switching to backup. {{Wikipedia:Sockpuppet investigations/Cases/Overview}}-->
@@ -749,6 +764,5 @@ class FindActiveCaseTemplateTest(TestCase):
         |}
         '''
 
-        wiki = Wiki()
         template = _find_active_case_template(wiki)
         self.assertIsNone(template)
@@ -171,3 +171,42 @@ class TimelineViewTest(ViewTestCase):
         self.assertEqual(response.context['events'], [
             TimelineEvent(datetime(2020, 1, 1), 1, 'Fred', 'create', 'create', 'Title', '<comment hidden>', ''),
         ])
+
+
+    def test_each_users_sources_are_fetched_once_and_merged(self):
+        self.mock_wiki.user_contributions.side_effect = lambda user, end: [
+            WikiContrib(101, datetime(2020, 1, 1), user, 0, f'{user} live', 'comment')]
+        self.mock_wiki.deleted_user_contributions.side_effect = lambda user: [
+            WikiContrib(102, datetime(2020, 1, 2), user, 0, f'{user} deleted', 'comment', False)]
+        self.mock_wiki.user_blocks.side_effect = lambda user: [
+            BlockEvent(user, datetime(2020, 1, 3), 103)]
+        self.mock_wiki.user_log_events.side_effect = lambda user: iter([
+            LogEvent(104, datetime(2020, 1, 4), user, f'{user} log', 'newusers', 'create', '')])
+        self.force_login()
+
+        response = self.client.get('/spi/timeline/Foo', {'users': ['u1', 'u2']})
+
+        self.mock_wiki.user_contributions.assert_has_calls([call('u1', end=None), call('u2', end=None)],
+                                                           any_order=True)
+        self.assertEqual(self.mock_wiki.user_contributions.call_count, 2)
+        for source in [self.mock_wiki.deleted_user_contributions,
+                       self.mock_wiki.user_blocks,
+                       self.mock_wiki.user_log_events]:
+            source.assert_has_calls([call('u1'), call('u2')], any_order=True)
+            self.assertEqual(source.call_count, 2)
+        # pylint: disable=line-too-long
+        self.assertCountEqual(response.context['events'], [
+            TimelineEvent(datetime(2020, 1, 4), 104, user, 'newusers', 'create', f'{user} log', '', '')
+            for user in ['u1', 'u2']
+        ] + [
+            TimelineEvent(datetime(2020, 1, 3), 103, user, 'block', '', 'indef', '', '')
+            for user in ['u1', 'u2']
+        ] + [
+            TimelineEvent(datetime(2020, 1, 2), 102, user, 'edit', 'deleted', f'{user} deleted', 'comment', '')
+            for user in ['u1', 'u2']
+        ] + [
+            TimelineEvent(datetime(2020, 1, 1), 101, user, 'edit', '', f'{user} live', 'comment', '')
+            for user in ['u1', 'u2']
+        ])
+        timestamps = [event.timestamp for event in response.context['events']]
+        self.assertEqual(timestamps, sorted(timestamps, reverse=True))
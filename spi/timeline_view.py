@@ -1,9 +1,11 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
+import asyncio
 import heapq
 import logging
 
+from asgiref.sync import async_to_sync, sync_to_async
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import render
 from django.views import View
@@ -76,21 +78,44 @@ class TimelineView(LoginRequiredMixin, View):
         """Returns an iterable over TimelineEvents.
 
         """
-        user_streams = [self.get_contribs_for_user(wiki, user),
-                        self.get_blocks_for_user(wiki, user),
-                        self.get_log_events_for_user(wiki, user)]
+        active, deleted, blocks, log_events = async_to_sync(self.fetch_user_data)(wiki, user)
+        user_streams = [self.get_contribs_for_user(user, active, deleted),
+                        self.get_blocks_for_user(blocks),
+                        self.get_log_events_for_user(log_events)]
         return heapq.merge(*user_streams, reverse=True)
 
 
-    def get_contribs_for_user(self, wiki, user_name):
+    @staticmethod
+    async def fetch_user_data(wiki, user_name):
+        """Returns a (live contribs, deleted contribs, block events, log
+        events) tuple of lists for the user.
+
+        These are independent API queries, so they're run
+        concurrently; the total time is that of the slowest one
+        rather than the sum of them all.
+
+        The queries run on worker threads, which don't have the
+        request's (thread-local) request id, so anything they log
+        shows up without it.
+
+        """
+        def run(func, *args):
+            return sync_to_async(func, thread_sensitive=False)(*args)
+
+        return await asyncio.gather(
+            run(lambda: CacheableUserContribs.get(wiki, user_name).data),
+            run(wiki.deleted_user_contributions, user_name),
+            run(wiki.user_blocks, user_name),
+            run(lambda: list(wiki.user_log_events(user_name))))
+
+
+    def get_contribs_for_user(self, user_name, active, deleted):
         """Returns an interable over TimelineEvents.
 
         As a side effect, updates self.tag_data.
 
         """
         self.tag_data[user_name] = defaultdict(int)
-        active = CacheableUserContribs.get(wiki, user_name).data
-        deleted = wiki.deleted_user_contributions(user_name)
         for contrib in heapq.merge(active, deleted, reverse=True):
             for tag in contrib.tags:
                 self.tag_data[user_name][tag] += 1
@@ -106,11 +131,11 @@ class TimelineView(LoginRequiredMixin, View):
 
 
     @staticmethod
-    def get_blocks_for_user(wiki, user_name):
+    def get_blocks_for_user(blocks):
         """Returns an interable over TimelineEvents.
 
         """
-        for block in wiki.user_blocks(user_name):
+        for block in blocks:
             if isinstance(block, BlockEvent):
                 yield TimelineEvent(block.timestamp,
                                     block.id,
@@ -137,11 +162,11 @@ class TimelineView(LoginRequiredMixin, View):
                                     '')
 
     @staticmethod
-    def get_log_events_for_user(wiki, user_name):
+    def get_log_events_for_user(log_events):
         """Returns an iterable over TimelineEvents.
 
         """
-        for event in wiki.user_log_events(user_name):
+        for event in log_events:
             yield TimelineEvent(event.timestamp,
                                 event.log_id,
                                 event.user_name,
@@ -1,14 +1,34 @@
+import atexit
 import logging
 import sys
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+from wiki_interface.wiki import close_connections
 
 
 logger = logging.getLogger('tools_app.apps')
 
 
+def configure_sqlite(sender, connection, **kwargs):  # pylint: disable=unused-argument
+    """Put sqlite into WAL mode, so readers don't block on writers
+    (mostly social_django's session and auth updates).
+
+    Django 3.1 doesn't support init_command in the sqlite OPTIONS, so
+    this is done from the connection_created signal.
+
+    """
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode=WAL;')
+            cursor.execute('PRAGMA synchronous=NORMAL;')
+
+
 class ToolsAppConfig(AppConfig):
     name = 'tools_app'
 
     def ready(self):
+        connection_created.connect(configure_sqlite)
+        atexit.register(close_connections)
         if 'manage.py' not in sys.argv[0]:
             logger.critical('%s starting (argv=%s)', self.name, sys.argv)
@@ -0,0 +1,54 @@
+import logging.handlers
+import os
+import queue
+
+
+class QueuedSocketHandler(logging.handlers.QueueHandler):
+    """A SocketHandler which does its network I/O on a background thread.
+
+    Emitting a record just puts it on a queue; a QueueListener thread
+    takes records off the queue and sends them to the socket.  This
+    keeps the (synchronous) socket writes out of the request path.
+
+    Configure it like a SocketHandler, i.e. with host and port.  The
+    listener thread is stopped, and any queued records flushed, when
+    the handler is closed, which logging does at exit.
+
+    Threads don't survive fork(), so the listener isn't started when
+    the handler is built (i.e. by dictConfig, possibly in a pre-fork
+    server's master process).  Instead, each process starts its own,
+    with its own queue and socket, the first time it emits a record.
+
+    """
+    def __init__(self, host, port):
+        super().__init__(None)
+        self.host = host
+        self.port = port
+        self.pid = None
+        self.socket_handler = None
+        self.listener = None
+
+
+    def emit(self, record):
+        if self.pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+
+
+    def _start_listener(self):
+        self.pid = os.getpid()
+        self.queue = queue.SimpleQueue()
+        self.socket_handler = logging.handlers.SocketHandler(self.host, self.port)
+        self.listener = logging.handlers.QueueListener(self.queue, self.socket_handler)
+        self.listener.start()
+
+
+    def close(self):
+        # A listener inherited across a fork belongs to the parent
+        # process; its thread doesn't exist here, so leave it alone.
+        if self.listener and self.pid == os.getpid():
+            self.listener.stop()
+            self.socket_handler.close()
+        self.listener = None
+        self.socket_handler = None
+        super().close()
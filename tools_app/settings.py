@@ -14,6 +14,7 @@ import os
 import re
 import sys
 import datetime
+import hashlib
 import tools_app.git
 from uuid import uuid4
 
@@ -70,12 +71,10 @@ INSTALLED_APPS = [
     'wiki_interface',
     'tools_app.apps.ToolsAppConfig',
     'social_django',
-    'debug_toolbar',
 ]
 
 MIDDLEWARE = [
     'log_request_id.middleware.RequestIDMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -88,6 +87,12 @@ MIDDLEWARE = [
     'tools_app.middleware.LoggingMiddleware',
 ]
 
+# The debug toolbar middleware does work on every request, even when
+# the toolbar isn't shown, so only install it on the dev tool.
+if DEBUG:
+    INSTALLED_APPS.append('debug_toolbar')
+    MIDDLEWARE.insert(1, 'debug_toolbar.middleware.DebugToolbarMiddleware')
+
 
 # This configuration uses a short timeout and invalidates every cache
 # entry on every server restart, which only makes sense for a
@@ -105,11 +110,31 @@ CACHES = {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
             'IGNORE_EXCEPTIONS': True,
         }
-    }
+    },
+    # Sessions need a KEY_PREFIX which is the same in every process and
+    # survives restarts, or processes would see each other's stale
+    # copies and entries would be orphaned.  Redis is shared by all
+    # tools, so the prefix is derived from the secret key rather than
+    # being guessable.  Entries expire along with their sessions.
+    'sessions': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache' if TESTING else 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://tools-redis.svc.eqiad.wmflabs:6379/0',
+        'KEY_PREFIX': hashlib.sha256(f'{TOOL_NAME}.sessions.{SECRET_KEY}'.encode()).hexdigest(),
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'IGNORE_EXCEPTIONS': True,
+        }
+    },
 }
 DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
 DJANGO_REDIS_LOGGER = 'tools_app.redis'
 
+# Sessions are read from the cache, falling back to the database on a
+# miss, so an authenticated request doesn't normally need to touch
+# sqlite to load its session.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'sessions'
+
 
 ROOT_URLCONF = 'tools_app.urls'
 
@@ -173,8 +198,10 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        'CONN_MAX_AGE': 60,
     }
 }
+# See also tools_app.apps.configure_sqlite(), which sets up WAL mode.
 
 
 # Password validation
@@ -244,13 +271,15 @@ LOGGING = {
             'formatter': 'file_formatter',
         },
         # Hack to get real-time logging, as a work-around to T256426 and T256482,
-        # but disable in testing due to https://code.djangoproject.com/ticket/29186
+        # but disable in testing due to https://code.djangoproject.com/ticket/29186.
+        # Records are sent from a background thread, so requests don't wait on the
+        # socket.
         'bastion': {
             'level': 'DEBUG',
             'class': 'logging.NullHandler',
         } if TESTING else {
             'level': 'DEBUG',
-            'class': 'logging.handlers.SocketHandler',
+            'class': 'tools_app.log_handlers.QueuedSocketHandler',
             'host': 'tools-sgebastion-08.tools.eqiad.wmflabs',
             'port': 23001,
         },
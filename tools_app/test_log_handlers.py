@@ -0,0 +1,69 @@
+import logging
+from unittest import TestCase
+from unittest.mock import patch, create_autospec
+
+from tools_app.log_handlers import QueuedSocketHandler
+
+
+def make_record(msg):
+    return logging.makeLogRecord({'msg': msg})
+
+
+class QueuedSocketHandlerTest(TestCase):
+    # pylint: disable=invalid-name
+
+    @patch('logging.handlers.SocketHandler', autospec=True)
+    def test_records_are_passed_to_socket_handler(self, mock_SocketHandler):
+        handler = QueuedSocketHandler('example.com', 23001)
+
+        handler.handle(make_record('hello world'))
+        handler.close()
+
+        mock_SocketHandler.assert_called_once_with('example.com', 23001)
+        mock_SocketHandler.return_value.handle.assert_called_once()
+        sent_record = mock_SocketHandler.return_value.handle.call_args[0][0]
+        self.assertEqual(sent_record.getMessage(), 'hello world')
+
+
+    @patch('logging.handlers.SocketHandler', autospec=True)
+    def test_listener_is_not_started_until_first_record(self, mock_SocketHandler):
+        handler = QueuedSocketHandler('example.com', 23001)
+
+        self.assertIsNone(handler.listener)
+        mock_SocketHandler.assert_not_called()
+        handler.close()
+
+
+    @patch('os.getpid')
+    @patch('logging.handlers.SocketHandler', autospec=True)
+    def test_forked_process_gets_its_own_listener(self, mock_SocketHandler, mock_getpid):
+        parent_socket_handler = create_autospec(logging.Handler, instance=True)
+        child_socket_handler = create_autospec(logging.Handler, instance=True)
+        mock_SocketHandler.side_effect = [parent_socket_handler, child_socket_handler]
+        handler = QueuedSocketHandler('example.com', 23001)
+
+        mock_getpid.return_value = 1000
+        handler.handle(make_record('parent'))
+        parent_listener = handler.listener
+        mock_getpid.return_value = 1001
+        handler.handle(make_record('child'))
+        handler.close()
+        parent_listener.stop()
+
+        self.assertEqual(mock_SocketHandler.call_count, 2)
+        parent_socket_handler.handle.assert_called_once()
+        self.assertEqual(parent_socket_handler.handle.call_args[0][0].getMessage(), 'parent')
+        child_socket_handler.handle.assert_called_once()
+        self.assertEqual(child_socket_handler.handle.call_args[0][0].getMessage(), 'child')
+
+
+    @patch('logging.handlers.SocketHandler', autospec=True)
+    def test_close_is_idempotent(self, mock_SocketHandler):
+        handler = QueuedSocketHandler('example.com', 23001)
+        handler.handle(make_record('hello'))
+
+        handler.close()
+        handler.close()
+
+        self.assertIsNone(handler.listener)
+        mock_SocketHandler.return_value.close.assert_called_once()
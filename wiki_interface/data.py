@@ -6,6 +6,9 @@ from dataclasses import dataclass, field
 from typing import List
 
 
+# Not slotted: dataclass(slots=True) needs python 3.10, and
+# hand-written __slots__ conflict with the is_live and tags defaults
+# (which become class attributes).
 @dataclass(frozen=True, order=True)
 class WikiContrib:
     '''If the comment is hidden
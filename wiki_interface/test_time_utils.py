@@ -2,9 +2,15 @@ from unittest import TestCase
 import time
 import datetime
 
-from wiki_interface.time_utils import struct_to_datetime
+from wiki_interface.time_utils import struct_to_datetime, iso_to_datetime
 
 class StructToDatetimeTest(TestCase):
     def test_convert(self):
         self.assertEqual(struct_to_datetime(time.struct_time((2001, 1, 2, 0, 0, 0, 0, 0, 0))),
                          datetime.datetime(2001, 1, 2, tzinfo=datetime.timezone.utc))
+
+
+class IsoToDatetimeTest(TestCase):
+    def test_convert(self):
+        self.assertEqual(iso_to_datetime('2001-01-02T03:04:05Z'),
+                         datetime.datetime(2001, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc))
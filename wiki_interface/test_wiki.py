@@ -9,17 +9,20 @@ from dateutil.parser import isoparse
 from django.conf import settings
 from django.http import HttpRequest
 from asgiref.sync import async_to_sync
+from requests_oauthlib import OAuth1
 
 import mwclient
 import mwclient.util
 import mwclient.errors
 
+import wiki_interface.wiki
 from wiki_interface.data import WikiContrib, LogEvent
-from wiki_interface.wiki import Wiki, Page, Category, MAX_UCUSER
+from wiki_interface.wiki import Wiki, Page, Category, MAX_UCUSER, REGISTRATION_CACHE_TIMEOUT
 from wiki_interface.block_utils import BlockEvent, UnblockEvent
 
 class ConstructorTest(TestCase):
     # pylint: disable=invalid-name
+    # pylint: disable=protected-access
 
     def setUp(self):
         site_patcher = patch('wiki_interface.wiki.Site', autospec=True)
@@ -28,17 +31,17 @@ class ConstructorTest(TestCase):
         self.addCleanup(site_patcher.stop)
 
 
-    def test_default_wiki_construction_creates_site_with_host_name_and_user_agent(self):
+    def test_default_wiki_construction_creates_site_with_host_name_and_shared_session(self):
         Wiki()
 
         self.MockSiteClass.assert_called_once()
         args, kwargs = self.MockSiteClass.call_args
         self.assertEqual(args, (settings.MEDIAWIKI_SITE_NAME,))
-        self.assertEqual(kwargs, {'clients_useragent': settings.MEDIAWIKI_USER_AGENT})
+        self.assertEqual(kwargs, {'pool': wiki_interface.wiki._SESSION})
 
 
     @patch('django.contrib.auth.get_user')
-    def test_wiki_construction_with_anonymous_request_creates_site_with_host_name_and_user_agent(self, mock_get_user):
+    def test_wiki_construction_with_anonymous_request_creates_site_with_host_name_and_shared_session(self, mock_get_user):
         mock_get_user().is_anonymous = True
 
         Wiki(HttpRequest())
@@ -46,7 +49,7 @@ class ConstructorTest(TestCase):
         self.MockSiteClass.assert_called_once()
         args, kwargs = self.MockSiteClass.call_args
         self.assertEqual(args, (settings.MEDIAWIKI_SITE_NAME,))
-        self.assertEqual(kwargs, {'clients_useragent': settings.MEDIAWIKI_USER_AGENT})
+        self.assertEqual(kwargs, {'pool': wiki_interface.wiki._SESSION})
 
 
     @patch('django.contrib.auth.get_user')
@@ -58,12 +61,27 @@ class ConstructorTest(TestCase):
         self.MockSiteClass.assert_called_once()
         args, kwargs = self.MockSiteClass.call_args
         self.assertEqual(args, (settings.MEDIAWIKI_SITE_NAME,))
-        self.assertEqual(set(kwargs.keys()), {'clients_useragent',
-                                              'consumer_token',
-                                              'consumer_secret',
-                                              'access_token',
-                                              'access_secret'})
-        self.assertEqual(kwargs['clients_useragent'], settings.MEDIAWIKI_USER_AGENT)
+        self.assertEqual(set(kwargs.keys()), {'pool'})
+        self.assertIsInstance(kwargs['pool'].auth, OAuth1)
+        self.assertTrue(kwargs['pool'].headers['User-Agent'].startswith(settings.MEDIAWIKI_USER_AGENT))
+
+
+    def test_default_session_sends_user_agent(self):
+        user_agent = wiki_interface.wiki._SESSION.headers['User-Agent']
+
+        self.assertTrue(user_agent.startswith(settings.MEDIAWIKI_USER_AGENT))
+
+
+    @patch('django.contrib.auth.get_user')
+    def test_wiki_construction_with_authenticated_request_shares_connection_pool(self, mock_get_user):
+        mock_get_user().is_anonymous = False
+
+        Wiki(HttpRequest())
+
+        _, kwargs = self.MockSiteClass.call_args
+        self.assertIsNot(kwargs['pool'], wiki_interface.wiki._SESSION)
+        self.assertIs(kwargs['pool'].get_adapter('https://en.wikipedia.org'),
+                      wiki_interface.wiki._SESSION.get_adapter('https://en.wikipedia.org'))
 
 
 
@@ -91,6 +109,49 @@ class NamespaceTest(WikiTestCase):
         self.assertEqual(wiki.namespace_values['Whatever'], 1)
 
 
+class GetRegistrationTimeTest(WikiTestCase):
+    #pylint: disable=invalid-name
+
+    @patch('wiki_interface.wiki.cache')
+    def test_get_registration_time_with_empty_cache(self, mock_cache):
+        mock_cache.get.return_value = None
+        self.mock_site.users.return_value.next.return_value = {'name': 'Fred',
+                                                               'registration': '2020-01-01T00:00:00Z'}
+        wiki = Wiki()
+
+        registration = wiki.get_registration_time('Fred')
+
+        self.assertEqual(registration, '2020-01-01T00:00:00Z')
+        self.mock_site.users.assert_called_once_with(users=['Fred'], prop=['registration'])
+        mock_cache.set.assert_called_once_with(
+            f'wiki_interface.registration.{settings.MEDIAWIKI_SITE_NAME}.Fred',
+            '2020-01-01T00:00:00Z',
+            REGISTRATION_CACHE_TIMEOUT)
+
+
+    @patch('wiki_interface.wiki.cache')
+    def test_get_registration_time_uses_cached_value(self, mock_cache):
+        mock_cache.get.return_value = '2020-01-01T00:00:00Z'
+        wiki = Wiki()
+
+        registration = wiki.get_registration_time('Fred')
+
+        self.assertEqual(registration, '2020-01-01T00:00:00Z')
+        self.mock_site.users.assert_not_called()
+
+
+    @patch('wiki_interface.wiki.cache')
+    def test_get_registration_time_does_not_cache_missing_value(self, mock_cache):
+        mock_cache.get.return_value = None
+        self.mock_site.users.return_value.next.return_value = {'name': 'Fred', 'missing': ''}
+        wiki = Wiki()
+
+        registration = wiki.get_registration_time('Fred')
+
+        self.assertIsNone(registration)
+        mock_cache.set.assert_not_called()
+
+
 class WikiContribTest(TestCase):
     def test_construct_default(self):
         contrib = WikiContrib(999, datetime(2020, 7, 30), 'user', 0, 'title', 'comment')
@@ -134,9 +195,10 @@ class UserContributionsTest(WikiTestCase):
 
         self.mock_site.usercontributions.assert_called_once_with(
             'fred',
-            prop='ids|title|timestamp|comment|flags|tags',
+            prop='ids|title|timestamp|comment|tags',
             show='',
-            end=None)
+            end=None,
+            limit='max')
         self.assertIsInstance(contributions[0], WikiContrib)
         self.assertEqual(contributions, [
             WikiContrib(20200730, datetime(2020, 7, 30, tzinfo=timezone.utc), 'fred', 0, 'p1', 'c1'),
@@ -157,9 +219,10 @@ class UserContributionsTest(WikiTestCase):
 
         self.mock_site.usercontributions.assert_called_once_with(
             'bob|alice',
-            prop='ids|title|timestamp|comment|flags|tags',
+            prop='ids|title|timestamp|comment|tags',
             show='',
-            end=None)
+            end=None,
+            limit='max')
         self.assertIsInstance(contributions[0], WikiContrib)
         self.assertEqual(contributions, [
             WikiContrib(20200730, datetime(2020, 7, 30, tzinfo=timezone.utc), 'bob', 0, 'p1', 'c1'),
@@ -209,13 +272,15 @@ class UserContributionsTest(WikiTestCase):
                                '|20|21|22|23|24|25|26|27|28|29'
                                '|30|31|32|33|34|35|36|37|38|39'
                                '|40|41|42|43|44|45|46|47|48|49',
-                               prop='ids|title|timestamp|comment|flags|tags',
+                               prop='ids|title|timestamp|comment|tags',
                                show='',
-                               end=None),
+                               end=None,
+                               limit='max'),
                           call('50|51|52|53|54',
-                               prop='ids|title|timestamp|comment|flags|tags',
+                               prop='ids|title|timestamp|comment|tags',
                                show='',
-                               end=None),
+                               end=None,
+                               limit='max'),
                          ])
         self.assertEqual(contributions, [
             WikiContrib(20200729, datetime(2020, 7, 29, tzinfo=timezone.utc), '0', 0, 'p1', 'c1'),
@@ -276,9 +341,10 @@ class UserContributionsTest(WikiTestCase):
 
         self.mock_site.usercontributions.assert_called_once_with(
             'fred',
-            prop='ids|title|timestamp|comment|flags|tags',
+            prop='ids|title|timestamp|comment|tags',
             show='',
-            end='2020-01-01T00:00:00')
+            end='2020-01-01T00:00:00',
+            limit='max')
         self.assertEqual(contributions, [])
 
 
@@ -324,9 +390,10 @@ class DeletedUserContributionsTest(WikiTestCase):
         args, kwargs = mock_List.call_args
         self.assertIsInstance(args[0], mwclient.Site)
         self.assertEqual(args[1:], ('alldeletedrevisions', 'adr'))
-        self.assertEqual(kwargs, {'uselang': None,
+        self.assertEqual(kwargs, {'limit': 'max',
+                                  'uselang': None,
                                   'adruser': 'fred',
-                                  'adrprop': 'ids|title|timestamp|comment|flags|tags'})
+                                  'adrprop': 'ids|title|timestamp|comment|tags'})
         self.assertEqual(items, [
             WikiContrib(20151125, datetime(2015, 11, 25, tzinfo=timezone.utc),
                         'fred', 0, 'p1', 'c1', is_live=False, tags=["t1"]),
@@ -392,9 +459,10 @@ class DeletedUserContributionsTest(WikiTestCase):
         args, kwargs = mock_List.call_args
         self.assertIsInstance(args[0], mwclient.Site)
         self.assertEqual(args[1:], ('alldeletedrevisions', 'adr'))
-        self.assertEqual(kwargs, {'uselang': None,
+        self.assertEqual(kwargs, {'limit': 'max',
+                                  'uselang': None,
                                   'adruser': 'fred',
-                                  'adrprop': 'ids|title|timestamp|comment|flags|tags'})
+                                  'adrprop': 'ids|title|timestamp|comment|tags'})
         expected_items = [
             WikiContrib(20160101, datetime(2016, 1, 1, tzinfo=timezone.utc),
                         'fred', 0, 'p2', 'c11', is_live=False, tags=[]),
@@ -453,9 +521,10 @@ class DeletedUserContributionsTest(WikiTestCase):
         args, kwargs = mock_List.call_args
         self.assertIsInstance(args[0], mwclient.Site)
         self.assertEqual(args[1:], ('alldeletedrevisions', 'adr'))
-        self.assertEqual(kwargs, {'uselang': None,
+        self.assertEqual(kwargs, {'limit': 'max',
+                                  'uselang': None,
                                   'adruser': 'fred',
-                                  'adrprop': 'ids|title|timestamp|comment|flags|tags'})
+                                  'adrprop': 'ids|title|timestamp|comment|tags'})
         self.assertEqual(items, [
             WikiContrib(999, datetime(2015, 11, 25, tzinfo=timezone.utc),
                         'fred', 0, 'p1', None, is_live=False, tags=["t1"]),
@@ -545,6 +614,25 @@ class UserBlocksTest(WikiTestCase):
         mock_logger.error.assert_not_called()
 
 
+    @patch('wiki_interface.wiki.logger')
+    def test_user_blocks_with_unblock_without_params(self, mock_logger):
+        jan_1 = '2020-01-01T00:00:00Z'
+
+        self.mock_site.logevents.return_value = iter([
+            {'logid': 1,
+             'title': 'User:fred',
+             'timestamp': mwclient.util.parse_timestamp(jan_1),
+             'type': 'block',
+             'action': 'unblock'},
+        ])
+        wiki = Wiki()
+
+        user_blocks = wiki.user_blocks('fred')
+
+        self.assertEqual(user_blocks, [UnblockEvent('fred', isoparse(jan_1), 1)])
+        mock_logger.error.assert_not_called()
+
+
     @patch('wiki_interface.wiki.logger')
     def test_user_blocks_with_unknown_action_logs_error_message(self, mock_logger):
         jan_1 = '2020-01-01T00:00:00Z'
@@ -820,6 +908,184 @@ class UserLogsTest(WikiTestCase):
             None)])
 
 
+class PagesExistTest(WikiTestCase):
+    #pylint: disable=invalid-name
+
+    def test_pages_exist_checks_all_titles_in_one_call(self):
+        self.mock_site.api.return_value = {
+            "batchcomplete": True,
+            "query": {
+                "pages": [{'title': 'Foo', 'pageid': 1},
+                          {'title': 'Bar', 'missing': True}]
+            }
+        }
+        wiki = Wiki()
+
+        result = wiki.pages_exist(['Foo', 'Bar'])
+
+        self.assertEqual(result, {'Foo': True, 'Bar': False})
+        self.mock_site.api.assert_called_once_with('query', titles='Foo|Bar', formatversion=2)
+
+
+    def test_pages_exist_uses_given_titles_as_keys(self):
+        self.mock_site.api.return_value = {
+            "batchcomplete": True,
+            "query": {
+                "normalized": [{'from': 'foo_bar', 'to': 'Foo bar'}],
+                "pages": [{'title': 'Foo bar', 'pageid': 1}]
+            }
+        }
+        wiki = Wiki()
+
+        result = wiki.pages_exist(['foo_bar'])
+
+        self.assertEqual(result, {'foo_bar': True})
+
+
+    def test_page_exists(self):
+        self.mock_site.api.return_value = {
+            "batchcomplete": True,
+            "query": {
+                "pages": [{'title': 'Foo', 'missing': True}]
+            }
+        }
+        wiki = Wiki()
+
+        self.assertFalse(wiki.page_exists('Foo'))
+
+
+class PageTextsTest(WikiTestCase):
+    #pylint: disable=invalid-name
+
+    def test_page_texts_fetches_all_titles_in_one_call(self):
+        self.mock_site.api.return_value = {
+            "batchcomplete": True,
+            "query": {
+                "pages": [{'title': 'Foo',
+                           'revisions': [{'slots': {'main': {'content': 'foo text'}}}]},
+                          {'title': 'Foo/Archive',
+                           'revisions': [{'slots': {'main': {'content': 'archive text'}}}]}]
+            }
+        }
+        wiki = Wiki()
+
+        texts = wiki.page_texts(['Foo', 'Foo/Archive'])
+
+        self.assertEqual(texts, {'Foo': 'foo text', 'Foo/Archive': 'archive text'})
+        self.mock_site.api.assert_called_once_with('query',
+                                                   prop='revisions',
+                                                   titles='Foo|Foo/Archive',
+                                                   formatversion=2,
+                                                   rvprop='content',
+                                                   rvslots='main')
+
+
+    def test_page_texts_maps_missing_pages_to_empty_string(self):
+        self.mock_site.api.return_value = {
+            "batchcomplete": True,
+            "query": {
+                "pages": [{'title': 'Foo',
+                           'revisions': [{'slots': {'main': {'content': 'foo text'}}}]},
+                          {'title': 'Foo/Archive',
+                           'missing': True}]
+            }
+        }
+        wiki = Wiki()
+
+        texts = wiki.page_texts(['Foo', 'Foo/Archive'])
+
+        self.assertEqual(texts, {'Foo': 'foo text', 'Foo/Archive': ''})
+
+
+    def test_page_texts_uses_given_titles_as_keys(self):
+        self.mock_site.api.return_value = {
+            "batchcomplete": True,
+            "query": {
+                "normalized": [{'from': 'foo_bar', 'to': 'Foo bar'}],
+                "pages": [{'title': 'Foo bar',
+                           'revisions': [{'slots': {'main': {'content': 'foo text'}}}]}]
+            }
+        }
+        wiki = Wiki()
+
+        texts = wiki.page_texts(['foo_bar'])
+
+        self.assertEqual(texts, {'foo_bar': 'foo text'})
+
+
+    def test_page_texts_follows_continuation(self):
+        self.mock_site.api.side_effect = [
+            {
+                "continue": {'rvcontinue': '2|2002', 'continue': '||'},
+                "query": {
+                    "pages": [{'title': 'Foo',
+                               'revisions': [{'slots': {'main': {'content': 'foo text'}}}]},
+                              {'title': 'Foo/Archive'}]
+                }
+            },
+            {
+                "batchcomplete": True,
+                "query": {
+                    "pages": [{'title': 'Foo'},
+                              {'title': 'Foo/Archive',
+                               'revisions': [{'slots': {'main': {'content': 'archive text'}}}]}]
+                }
+            },
+        ]
+        wiki = Wiki()
+
+        texts = wiki.page_texts(['Foo', 'Foo/Archive'])
+
+        self.assertEqual(texts, {'Foo': 'foo text', 'Foo/Archive': 'archive text'})
+        self.assertEqual(self.mock_site.api.call_count, 2)
+        self.mock_site.api.assert_called_with('query',
+                                              prop='revisions',
+                                              titles='Foo|Foo/Archive',
+                                              formatversion=2,
+                                              rvprop='content',
+                                              rvslots='main',
+                                              **{'rvcontinue': '2|2002', 'continue': '||'})
+
+
+    def test_page_text(self):
+        self.mock_site.api.return_value = {
+            "batchcomplete": True,
+            "query": {
+                "pages": [{'title': 'Foo',
+                           'revisions': [{'slots': {'main': {'content': 'foo text'}}}]}]
+            }
+        }
+        wiki = Wiki()
+
+        self.assertEqual(wiki.page_text('Foo'), 'foo text')
+        self.mock_site.pages.__getitem__.assert_not_called()
+
+
+class LatestRevisionIdsTest(WikiTestCase):
+    #pylint: disable=invalid-name
+
+    def test_latest_revision_ids_fetches_all_titles_in_one_call(self):
+        self.mock_site.api.return_value = {
+            "batchcomplete": True,
+            "query": {
+                "pages": [{'title': 'Foo',
+                           'revisions': [{'revid': 1001, 'parentid': 1000}]},
+                          {'title': 'Foo/Archive',
+                           'missing': True}]
+            }
+        }
+        wiki = Wiki()
+
+        rev_ids = wiki.latest_revision_ids(['Foo', 'Foo/Archive'])
+
+        self.assertEqual(rev_ids, {'Foo': 1001, 'Foo/Archive': None})
+        self.mock_site.api.assert_called_once_with('query',
+                                                   prop='revisions',
+                                                   titles='Foo|Foo/Archive',
+                                                   formatversion=2,
+                                                   rvprop='ids')
+
+
 class GetPageTest(WikiTestCase):
     #pylint: disable=invalid-name
 
@@ -6,3 +6,14 @@ def struct_to_datetime(struct_time):
 
     """
     return datetime.fromtimestamp(mktime(struct_time), tz=timezone.utc)
+
+
+def iso_to_datetime(timestamp):
+    """Convert an ISO-8601 timestamp as returned by the MediaWiki API
+    (i.e. 2001-01-02T03:04:05Z) to a UTC aware datetime.
+
+    This only handles the one format MediaWiki uses, which makes it a
+    lot faster than dateutil's general-purpose isoparse().
+
+    """
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
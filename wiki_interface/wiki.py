@@ -19,18 +19,21 @@ import re
 
 import django.contrib.auth
 from django.conf import settings
+from django.core.cache import cache
 from asgiref.sync import sync_to_async
 
+import requests
+from requests.adapters import HTTPAdapter
+from requests_oauthlib import OAuth1
 from mwclient import Site
 from mwclient.listing import List
 from mwclient.errors import APIError
 import mwclient
-from dateutil.parser import isoparse
 from more_itertools import always_iterable, chunked, consume
 
 from wiki_interface.data import WikiContrib, LogEvent
 from wiki_interface.block_utils import BlockEvent, UnblockEvent
-from wiki_interface.time_utils import struct_to_datetime
+from wiki_interface.time_utils import struct_to_datetime, iso_to_datetime
 
 
 logger = logging.getLogger('wiki_interface')
@@ -38,6 +41,47 @@ logger = logging.getLogger('wiki_interface')
 
 MAX_UCUSER = 50  # See https://www.mediawiki.org/wiki/API:Usercontribs.
 MAX_USUSER = 50  # See https://www.mediawiki.org/wiki/API:Users
+MAX_TITLES = 50  # See https://www.mediawiki.org/wiki/API:Query
+
+# Ask for as many results per API call as the server allows for the
+# current user; 500 normally, 5000 for users with the apihighlimits
+# right (admins, bots).  Fewer calls means fewer continuation round trips.
+# See https://www.mediawiki.org/wiki/API:Query#Example_5:_Continuing_queries
+API_LIMIT = 'max'
+
+# Registration times never change, but the cache's KEY_PREFIX does on
+# every restart, so entries need a finite timeout or they'd be left
+# behind in the (shared) redis forever.
+REGISTRATION_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # One week, in seconds.
+
+
+# All the HTTP traffic to the wiki goes through a single connection
+# pool, so keepalive connections (and their TLS sessions) get reused
+# across Wiki instances, i.e. across django requests.  Anonymous
+# access shares one Session.  Authenticated users each get their own
+# Session (so credentials and cookies stay separate), mounted on the
+# same adapter.
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+
+
+def _make_session(auth=None):
+    session = requests.Session()
+    session.mount('https://', _ADAPTER)
+    session.auth = auth
+    session.headers['User-Agent'] = f'{settings.MEDIAWIKI_USER_AGENT} {mwclient.client.USER_AGENT}'
+    return session
+
+
+_SESSION = _make_session()
+
+
+def close_connections():
+    """Close all the pooled connections to the wiki.  Intended to be
+    called at process shutdown.
+
+    """
+    _SESSION.close()
+    _ADAPTER.close()
 
 
 class Wiki:
@@ -67,28 +111,128 @@ class Wiki:
         # is authenticated.  Maybe with an AnonymousUser, everything just
         # works?  If so, these two code paths could be merged.
         if user is None or user.is_anonymous:
-            auth_info = {}
+            session = _SESSION
         else:
             access_token = (user
                             .social_auth
                             .get(provider='mediawiki')
                             .extra_data['access_token'])
-            auth_info = {
-                'consumer_token': settings.SOCIAL_AUTH_MEDIAWIKI_KEY,
-                'consumer_secret': settings.SOCIAL_AUTH_MEDIAWIKI_SECRET,
-                'access_token': access_token['oauth_token'],
-                'access_secret': access_token['oauth_token_secret']
-            }
+            # mwclient ignores its own auth arguments when it's handed
+            # a pool, so the OAuth credentials go on the session.
+            session = _make_session(OAuth1(settings.SOCIAL_AUTH_MEDIAWIKI_KEY,
+                                           settings.SOCIAL_AUTH_MEDIAWIKI_SECRET,
+                                           access_token['oauth_token'],
+                                           access_token['oauth_token_secret']))
 
-        return Site(settings.MEDIAWIKI_SITE_NAME,
-                    clients_useragent=settings.MEDIAWIKI_USER_AGENT,
-                    **auth_info)
+        # Likewise for clients_useragent; the User-Agent is set on the
+        # session by _make_session().
+        return Site(settings.MEDIAWIKI_SITE_NAME, pool=session)
 
 
     def page_exists(self, title):
         """Return True if the page exists, False otherwise."""
 
-        return self.site.pages[title].exists
+        return self.pages_exist([title])[title]
+
+
+    def pages_exist(self, titles):
+        """Check whether several pages exist, in as few API calls as
+        possible (see _query_pages()).
+
+        Returns a dict mapping each of the given titles to True if the
+        page exists, False otherwise.
+
+        """
+        pages = self._query_pages(titles)
+        return {title: bool(page) and 'missing' not in page and 'invalid' not in page
+                for title, page in pages.items()}
+
+
+    def page_text(self, title):
+        """Get the current wikitext of a page, or the empty string if
+        the page doesn't exist.
+
+        This is cheaper than page(title).text(), which costs two API
+        calls; one to build the mwclient Page, and another to get the
+        text.
+
+        """
+        return self.page_texts([title])[title]
+
+
+    def page_texts(self, titles):
+        """Get the current wikitext of several pages, in as few API
+        calls as possible (see _query_pages()).
+
+        Returns a dict mapping each of the given titles to its text.
+        As with Page.text(), pages which don't exist map to the empty
+        string.
+
+        """
+        revisions = self._latest_revisions(titles, rvprop='content', rvslots='main')
+        return {title: rev['slots']['main']['content'] if rev else ''
+                for title, rev in revisions.items()}
+
+
+    def latest_revision_ids(self, titles):
+        """Get the id of the current revision of several pages, in as
+        few API calls as possible (see _query_pages()).
+
+        Returns a dict mapping each of the given titles to a revision
+        id, or None if the page doesn't exist.
+
+        """
+        revisions = self._latest_revisions(titles, rvprop='ids')
+        return {title: rev['revid'] if rev else None
+                for title, rev in revisions.items()}
+
+
+    def _latest_revisions(self, titles, **kwargs):
+        """Returns a dict mapping each of the given titles to the
+        API's data for the page's current revision, or None if the
+        page doesn't exist.  Any kwargs are passed to the API.
+
+        """
+        pages = self._query_pages(titles, prop='revisions', **kwargs)
+        return {title: page['revisions'][0] if 'revisions' in page else None
+                for title, page in pages.items()}
+
+
+    def _query_pages(self, titles, **kwargs):
+        """Query the API about several pages.
+
+        Titles are sent in batches (one API call per MAX_TITLES
+        titles) instead of one call per page.  The API may not return
+        everything for a batch in one response (e.g. if the content of
+        the pages exceeds the response size limit); if so, the query
+        is continued until it has.
+
+        Returns a dict mapping each of the given titles (as passed in,
+        i.e. before any normalization done by the API) to the API's
+        data for the page, or an empty dict if the API didn't return
+        the page.  Any kwargs are passed to the API.
+
+        """
+        titles = list(titles)
+        pages = {}
+        normalized = {}
+        for chunk in chunked(titles, MAX_TITLES):
+            params = {}
+            while True:
+                api_result = self.site.api('query',
+                                           titles='|'.join(chunk),
+                                           formatversion=2,
+                                           **kwargs,
+                                           **params)
+                query = api_result['query']
+                for page in query['pages']:
+                    pages.setdefault(page['title'], {}).update(page)
+                for normalization in query.get('normalized', []):
+                    normalized[normalization['from']] = normalization['to']
+                if 'continue' not in api_result:
+                    break
+                params = api_result['continue']
+        return {title: pages.get(normalized.get(title, title), {}) for title in titles}
 
 
     def get_registration_time(self, user):
@@ -96,13 +240,20 @@ class Wiki:
 
         If the registration time can't be determined, returns None.
 
+        Registration times never change, so they're cached for a
+        long time (REGISTRATION_CACHE_TIMEOUT).  Misses aren't cached,
+        since the user may register later.
+
         """
-        registrations = self.site.users(users=[user], prop=['registration'])
-        userinfo = registrations.next()
-        try:
-            return userinfo['registration']
-        except KeyError:
-            return None
+        key = f'wiki_interface.registration.{settings.MEDIAWIKI_SITE_NAME}.{user}'
+        registration = cache.get(key)
+        if registration is None:
+            registrations = self.site.users(users=[user], prop=['registration'])
+            userinfo = registrations.next()
+            registration = userinfo.get('registration')
+            if registration is not None:
+                cache.set(key, registration, REGISTRATION_CACHE_TIMEOUT)
+        return registration
 
 
     def user_contributions(self, user_name_or_names, show='', end=None):
@@ -127,10 +278,13 @@ class Wiki:
                 raise ValueError(f'"|" in user name: {str_name}')
             all_names.append(str_name)
 
-        props = 'ids|title|timestamp|comment|flags|tags'
+        props = 'ids|title|timestamp|comment|tags'
         for chunk in chunked(all_names, MAX_UCUSER):
-            for contrib in self.site.usercontributions('|'.join(chunk), show=show, prop=props, end=end):
-                logger.debug("contrib = %s", contrib)
+            for contrib in self.site.usercontributions('|'.join(chunk),
+                                                       show=show,
+                                                       prop=props,
+                                                       end=end,
+                                                       limit=API_LIMIT):
                 yield WikiContrib(contrib['revid'],
                                   struct_to_datetime(contrib['timestamp']),
                                   contrib['user'],
@@ -158,10 +312,11 @@ class Wiki:
         """
         kwargs = dict(List.generate_kwargs('adr',
                                            user=user_name,
-                                           prop='ids|title|timestamp|comment|flags|tags'))
+                                           prop='ids|title|timestamp|comment|tags'))
         listing = List(self.site,
                        'alldeletedrevisions',
                        'adr',
+                       limit=API_LIMIT,
                        uselang=None,  # unclear why this is needed
                        **kwargs)
 
@@ -174,8 +329,7 @@ class Wiki:
                 namespace = page['ns']
                 for revision in page['revisions']:
                     rev_id = revision['revid']
-                    logger.debug("deleted revision = %s", revision)
-                    timestamp = isoparse(revision['timestamp'])
+                    timestamp = iso_to_datetime(revision['timestamp'])
                     comment = revision['comment'] if 'commenthidden' not in revision else None
                     tags = revision['tags']
                     contribs.append(WikiContrib(
@@ -210,12 +364,10 @@ class Wiki:
             action = block['action']
             timestamp = struct_to_datetime(block['timestamp'])
             id = block['logid']
-            mw_expiry = block['params'].get('expiry')
-            expiry = mw_expiry and isoparse(mw_expiry)
-            if action == 'block':
-                events.append(BlockEvent(user_name, timestamp, id, expiry))
-            elif action == 'reblock':
-                events.append(BlockEvent(user_name, timestamp, id, expiry, is_reblock=True))
+            if action in ('block', 'reblock'):
+                mw_expiry = block['params'].get('expiry')
+                expiry = mw_expiry and iso_to_datetime(mw_expiry)
+                events.append(BlockEvent(user_name, timestamp, id, expiry, is_reblock=action == 'reblock'))
             elif action == 'unblock':
                 events.append(UnblockEvent(user_name, timestamp, id))
             else: